@@ -0,0 +1,20 @@
+# Wrapper to generate every visualization in one process, sharing one figure
+# unless SHOW=1 asks for a window per plot
+import os, sys
+here = os.path.dirname(os.path.abspath(__file__))
+root = os.path.abspath(os.path.join(here, '..'))
+os.chdir(root)
+sys.path.insert(0, root)
+# The visualization modules pick the backend when imported
+import visualize_carbon_data, visualize_hierarchical_data
+import matplotlib.pyplot as plt
+
+if visualize_carbon_data.SHOW:
+    # One window per plot, so each needs its own figure
+    visualize_carbon_data.main(show=False)
+    visualize_hierarchical_data.main(show=False)
+    plt.show()
+else:
+    _FIG = plt.figure(figsize=(18, 12))
+    visualize_carbon_data.main(fig=_FIG)
+    visualize_hierarchical_data.main(fig=_FIG)
@@ -1,6 +1,8 @@
 # Wrapper to run from this project folder
-import os, subprocess, sys
+import os, sys
 here = os.path.dirname(os.path.abspath(__file__))
 root = os.path.abspath(os.path.join(here, '..'))
 os.chdir(root)
-subprocess.check_call([sys.executable, os.path.join(root, 'visualize_carbon_data.py')])
+sys.path.insert(0, root)
+import visualize_carbon_data
+visualize_carbon_data.main()
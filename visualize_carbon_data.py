@@ -4,30 +4,58 @@ Single-tier Carbon Trading Network Visualization
 Generates graphs from the single-tier simulation results
 """
 
+import os
+
+import matplotlib
+
+# Render off-screen unless a plot window was asked for with SHOW=1
+SHOW = os.environ.get("SHOW", "").lower() in ("1", "true", "yes")
+if not SHOW:
+    matplotlib.use("Agg", force=True)
 import matplotlib.pyplot as plt
 import numpy as np
+from matplotlib.font_manager import FontProperties
 
 # Sample data for 10 sensors (single-tier)
 sensor_ids = [f'S{i+1}' for i in range(10)]
 avg_co2 = [405, 475, 470, 568, 593, 629, 680, 734, 825, 838]
 
-fig, ax = plt.subplots(figsize=(12, 6))
-bars = ax.bar(sensor_ids, avg_co2, color='skyblue', edgecolor='black')
-ax.set_xlabel('Sensor ID', fontweight='bold')
-ax.set_ylabel('Average CO2 (ppm)', fontweight='bold')
-ax.set_title('Single-Tier CO2 Sensor Network - Average CO2 per Sensor', 
-             fontweight='bold')
-ax.grid(axis='y', alpha=0.3)
-ax.axhline(y=400, color='green', linestyle='--', linewidth=2, 
-            label='Normal (400 ppm)', alpha=0.6)
-
-for bar, val in zip(bars, avg_co2):
-    ax.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 10,
-             f'{val}', ha='center', va='bottom', fontweight='bold')
-
-plt.tight_layout()
-output_file = 'carbon_trading_visualization.png'
-plt.savefig(output_file, dpi=300, bbox_inches='tight')
-print(f"✓ Single-tier visualization saved as: {output_file}")
-
-plt.show()
+# Bold fonts by size, built once and shared by every bold text artist
+FP_BOLD = {size: FontProperties(weight='bold', size=size)
+           for size in ('medium', 'large')}
+
+
+def main(fig=None, show=SHOW):
+    # Reuse the caller's figure when given one (see tools/visualize_all.py)
+    owns_fig = fig is None
+    if owns_fig:
+        fig = plt.figure(figsize=(12, 6), layout='constrained')
+    else:
+        fig.clear()
+        fig.set_size_inches(12, 6)
+        fig.set_layout_engine('constrained')
+    ax = fig.subplots()
+    bars = ax.bar(sensor_ids, avg_co2, color='skyblue', edgecolor='black')
+    ax.set_xlabel('Sensor ID', fontproperties=FP_BOLD['medium'])
+    ax.set_ylabel('Average CO2 (ppm)', fontproperties=FP_BOLD['medium'])
+    ax.set_title('Single-Tier CO2 Sensor Network - Average CO2 per Sensor', 
+                 fontproperties=FP_BOLD['large'])
+    ax.grid(axis='y', alpha=0.3)
+    ax.axhline(y=400, color='green', linestyle='--', linewidth=2, 
+                label='Normal (400 ppm)', alpha=0.6)
+
+    ax.bar_label(bars, labels=[f'{val}' for val in avg_co2], padding=3,
+                 fontproperties=FP_BOLD['medium'])
+
+    output_file = 'carbon_trading_visualization.png'
+    fig.savefig(output_file, dpi=300,
+                pil_kwargs={"compress_level": 3, "optimize": False})
+    print(f"✓ Single-tier visualization saved as: {output_file}")
+
+    # A caller-provided figure is shown (or reused) by the caller
+    if show and owns_fig:
+        plt.show()
+
+
+if __name__ == "__main__":
+    main()